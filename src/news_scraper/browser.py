@@ -1,9 +1,11 @@
 """Browser module for headless page rendering."""
 
+import atexit
+import threading
 from contextlib import suppress
 
 from playwright.sync_api import Error as PlaywrightError
-from playwright.sync_api import sync_playwright
+from playwright.sync_api import Browser, Playwright, Route, sync_playwright
 
 # Realistic Chrome User-Agent to avoid bot detection
 DEFAULT_USER_AGENT = (
@@ -12,6 +14,21 @@ DEFAULT_USER_AGENT = (
     "Chrome/120.0.0.0 Safari/537.36"
 )
 
+# Turn off Chrome subsystems a headless scraper never uses
+CHROME_ARGS = (
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--no-first-run",
+    "--mute-audio",
+)
+
+# Resource types the parsers never need; image URLs are read from the DOM
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media"})
+
 
 class BrowserError(Exception):
     """Exception raised when browser operations fail."""
@@ -28,11 +45,79 @@ class BrowserError(Exception):
         super().__init__(message)
 
 
+class _BrowserPool:
+    """Process-wide headless Chrome shared by every fetch.
+
+    Launching Chrome dominates the cost of a fetch, so the browser is
+    started on first use and kept for the life of the process. Each
+    fetch gets its own context, which keeps cookies and storage isolated
+    between pages.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty pool; nothing is launched until needed."""
+        self._lock = threading.Lock()
+        self._playwright: Playwright | None = None
+        self._browser: Browser | None = None
+
+    def get_browser(self) -> Browser:
+        """Return the shared browser, launching it on first use.
+
+        A browser that has crashed or disconnected is replaced.
+
+        Returns:
+            A connected Playwright Browser.
+
+        Raises:
+            PlaywrightError: If Playwright or the browser fails to start.
+        """
+        with self._lock:
+            if self._browser is not None and self._browser.is_connected():
+                return self._browser
+            self._close_locked()
+            self._playwright = sync_playwright().start()
+            try:
+                self._browser = self._playwright.chromium.launch(
+                    headless=True, channel="chrome", args=list(CHROME_ARGS)
+                )
+            except PlaywrightError:
+                self._close_locked()
+                raise
+            return self._browser
+
+    def close(self) -> None:
+        """Close the shared browser and stop Playwright, if running."""
+        with self._lock:
+            self._close_locked()
+
+    def _close_locked(self) -> None:
+        browser, self._browser = self._browser, None
+        playwright, self._playwright = self._playwright, None
+        if browser is not None:
+            with suppress(PlaywrightError):
+                browser.close()
+        if playwright is not None:
+            with suppress(PlaywrightError):
+                playwright.stop()
+
+
+def _block_heavy_resources(route: Route) -> None:
+    """Abort requests for resources that do not affect the rendered HTML."""
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        route.abort()
+    else:
+        route.continue_()
+
+
+_pool = _BrowserPool()
+atexit.register(_pool.close)
+
+
 def fetch_rendered_html(url: str, timeout: int = 30000) -> str:
     """Fetch fully-rendered HTML from a URL using headless browser.
 
-    Launches headless Chrome, navigates to the URL, waits for the page
-    to load, and returns the rendered HTML.
+    Opens a fresh context on the shared headless Chrome, navigates to
+    the URL, waits for the page to load, and returns the rendered HTML.
 
     Args:
         url: The URL to fetch.
@@ -45,17 +130,17 @@ def fetch_rendered_html(url: str, timeout: int = 30000) -> str:
         BrowserError: If browser launch or navigation fails.
     """
     try:
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True, channel="chrome")
-            try:
-                context = browser.new_context(user_agent=DEFAULT_USER_AGENT)
-                page = context.new_page()
-                page.goto(url, timeout=timeout, wait_until="domcontentloaded")
-                # Best-effort extra settling time for dynamic pages.
-                with suppress(PlaywrightError):
-                    page.wait_for_load_state("networkidle", timeout=5000)
-                return page.content()
-            finally:
-                browser.close()
+        browser = _pool.get_browser()
+        context = browser.new_context(user_agent=DEFAULT_USER_AGENT)
+        try:
+            context.route("**/*", _block_heavy_resources)
+            page = context.new_page()
+            page.goto(url, timeout=timeout, wait_until="domcontentloaded")
+            # Best-effort extra settling time for dynamic pages.
+            with suppress(PlaywrightError):
+                page.wait_for_load_state("networkidle", timeout=5000)
+            return page.content()
+        finally:
+            context.close()
     except PlaywrightError as e:
         raise BrowserError(str(e), url) from e
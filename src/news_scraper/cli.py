@@ -79,34 +79,36 @@ def scrape_cmd(
 
     requested_sources = source_names or []
 
+    # Validate and normalize all source names before touching the database
+    normalized_names: list[str] = []
+    for source_name in requested_sources:
+        try:
+            normalized = validate_slug(source_name, field_name="source")
+            normalized_names.append(normalized)
+        except ValidationError as e:
+            log.error("Invalid source name", source=source_name, error=str(e))
+            console.print(f"[red]Error:[/red] {e.message}")
+            raise typer.Exit(code=1) from None
+
+    # Deduplicate while preserving order
+    seen: set[str] = set()
+    unique_normalized: list[str] = []
+    for name in normalized_names:
+        if name not in seen:
+            seen.add(name)
+            unique_normalized.append(name)
+
     with get_session() as session:
         sources_to_scrape: list[Source] = []
 
-        if requested_sources:
-            # Validate and normalize all source names
-            normalized_names: list[str] = []
-            for source_name in requested_sources:
-                try:
-                    normalized = validate_slug(source_name, field_name="source")
-                    normalized_names.append(normalized)
-                except ValidationError as e:
-                    log.error("Invalid source name", source=source_name, error=str(e))
-                    console.print(f"[red]Error:[/red] {e.message}")
-                    raise typer.Exit(code=1) from None
-
-            # Deduplicate while preserving order
-            seen: set[str] = set()
-            unique_normalized: list[str] = []
-            for name in normalized_names:
-                if name not in seen:
-                    seen.add(name)
-                    unique_normalized.append(name)
-
-            # Lookup sources
+        if unique_normalized:
+            # Lookup all requested sources in one query
+            stmt = select(Source).where(Source.name.in_(unique_normalized))
+            sources_by_name = {s.name: s for s in session.scalars(stmt)}
+
             missing_or_disabled: list[str] = []
             for normalized_name in unique_normalized:
-                stmt = select(Source).where(Source.name == normalized_name)
-                source = session.scalars(stmt).first()
+                source = sources_by_name.get(normalized_name)
 
                 if source is None:
                     missing_or_disabled.append(normalized_name)
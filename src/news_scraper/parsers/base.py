@@ -3,16 +3,19 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from typing import ClassVar, TypedDict
+from urllib.parse import urljoin
 
-from bs4 import BeautifulSoup, Tag
+from bs4 import BeautifulSoup, SoupStrainer, Tag
 
 from news_scraper.logging import get_logger
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ParsedArticle:
     """Represents a parsed news article from a front page.
 
@@ -60,15 +63,47 @@ class BaseParser(ABC):
 
     source: ClassVar[str] = ""
     base_url: ClassVar[str]
-    allowed_hosts: ClassVar[set[str]]
+    allowed_hosts: ClassVar[frozenset[str]]
+    # BeautifulSoup tree builder; subclasses may override (e.g. "html.parser").
+    parser_backend: ClassVar[str] = "lxml"
+    # Restrict tree construction to matching subtrees; None builds the full DOM.
+    parse_only: ClassVar[SoupStrainer | None] = None
+    # Substring every page with articles contains; skips parsing when absent.
+    html_marker: ClassVar[str | None] = None
+
+    def parse(self, html: str | bytes) -> list[ParsedArticle]:
+        """Parse HTML and extract articles with shared behavior.
+
+        Accepts decoded text or raw UTF-8 bytes; bytes are handed to the
+        parser as-is instead of being decoded first.
+        """
+        if not self._has_marker(html):
+            return []
 
-    def parse(self, html: str) -> list[ParsedArticle]:
-        """Parse HTML and extract articles with shared behavior."""
-        log = get_logger()
         soup = self.build_soup(html)
-        articles: list[ParsedArticle] = []
+        return [
+            ParsedArticle(
+                headline=title,
+                url=url,
+                position=position,
+                summary=summary,
+                image_url=image_url,
+            )
+            for position, (title, url, summary, image_url) in enumerate(
+                self._iter_valid_articles(soup), start=1
+            )
+        ]
+
+    def _iter_valid_articles(
+        self, soup: BeautifulSoup
+    ) -> Iterator[tuple[str, str, str | None, str | None]]:
+        """Yield (title, url, summary, image_url) for valid, unique articles.
+
+        Elements that fail to parse, lack required fields or duplicate an
+        earlier URL are logged with their element index and skipped.
+        """
+        log = get_logger()
         seen: set[str] = set()
-        position = 0
 
         for index, element in enumerate(self.iter_article_elements(soup), start=1):
             if not isinstance(element, Tag):
@@ -103,18 +138,6 @@ class BaseParser(ABC):
 
                 summary = (parsed.get("summary") or "").strip() or None
                 image_url = (parsed.get("image_url") or "").strip() or None
-
-                position += 1
-                articles.append(
-                    ParsedArticle(
-                        headline=title,
-                        url=url,
-                        position=position,
-                        summary=summary,
-                        image_url=image_url,
-                    )
-                )
-                seen.add(dedupe_key)
             except Exception:
                 log.exception(
                     "Failed to parse article element",
@@ -124,11 +147,46 @@ class BaseParser(ABC):
                 )
                 continue
 
-        return articles
+            seen.add(dedupe_key)
+            yield title, url, summary, image_url
+
+    def parse_many(
+        self, htmls: Iterable[str | bytes], max_workers: int | None = None
+    ) -> list[list[ParsedArticle]]:
+        """Parse several documents in worker processes, preserving input order.
+
+        Tree building is CPU-bound Python, so processes (not threads) are
+        used. A single document is parsed inline to avoid pool startup.
+        """
+        documents = list(htmls)
+        if len(documents) <= 1:
+            return [self.parse(html) for html in documents]
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self.parse, documents))
 
-    def build_soup(self, html: str) -> BeautifulSoup:
+    def build_soup(self, html: str | bytes) -> BeautifulSoup:
         """Build BeautifulSoup instance (override for custom parsing)."""
-        return BeautifulSoup(html, "lxml")
+        if isinstance(html, bytes):
+            return BeautifulSoup(
+                html,
+                self.parser_backend,
+                parse_only=self.parse_only,
+                from_encoding="utf-8",
+            )
+        return BeautifulSoup(html, self.parser_backend, parse_only=self.parse_only)
+
+    def _has_marker(self, html: str | bytes) -> bool:
+        """Return True if html contains html_marker (or no marker is set)."""
+        if self.html_marker is None:
+            return True
+        if isinstance(html, bytes):
+            return self.html_marker.encode() in html
+        return self.html_marker in html
+
+    def _resolve_image_url(self, url: str) -> str:
+        """Resolve a relative, protocol-relative or absolute image URL."""
+        return urljoin(self.base_url, url)
 
     def dedupe_key(self, url: str) -> str:
         """Return deduplication key for a normalized URL."""
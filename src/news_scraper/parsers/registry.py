@@ -16,6 +16,8 @@ class ParserNotFoundError(Exception):
 
 
 _PARSERS: dict[str, type[BaseParser]] = {}
+# Parsers hold no per-parse state, so one shared instance per source suffices.
+_INSTANCES: dict[str, BaseParser] = {}
 
 
 def register_parser(source_name: str) -> Callable[[type[BaseParser]], type[BaseParser]]:
@@ -33,8 +35,15 @@ def register_parser(source_name: str) -> Callable[[type[BaseParser]], type[BaseP
 
 
 def get_parser(source_name: str) -> BaseParser:
-    """Get a parser instance for a source."""
-    parser_cls = _PARSERS.get(source_name.lower())
+    """Get the shared parser instance for a source."""
+    # Source names are stored lowercase; try the name as given before lowering.
+    parser = _INSTANCES.get(source_name) or _INSTANCES.get(source_name.lower())
+    if parser is not None:
+        return parser
+
+    key = source_name.lower()
+    parser_cls = _PARSERS.get(key)
     if parser_cls is None:
         raise ParserNotFoundError(source_name)
-    return parser_cls()
+    parser = _INSTANCES[key] = parser_cls()
+    return parser
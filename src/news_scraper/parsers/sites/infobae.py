@@ -3,13 +3,17 @@
 from __future__ import annotations
 
 from typing import cast
-from urllib.parse import urljoin
 
 from bs4 import BeautifulSoup, Tag
 
 from news_scraper.parsers.base import BaseParser, ParsedArticleData
 from news_scraper.parsers.registry import register_parser
-from news_scraper.parsers.utils import first_srcset_url, resolve_url
+from news_scraper.parsers.utils import (
+    class_strainer,
+    first_srcset_url,
+    node_text,
+    resolve_url,
+)
 
 
 @register_parser("infobae")
@@ -17,7 +21,9 @@ class InfobaeParser(BaseParser):
     """Parser for Infobae front page HTML."""
 
     base_url = "https://www.infobae.com"
-    allowed_hosts = {"www.infobae.com", "infobae.com"}
+    allowed_hosts = frozenset({"www.infobae.com", "infobae.com"})
+    parse_only = class_strainer("story-card-ctn")
+    html_marker = "story-card-ctn"
 
     def iter_article_elements(self, soup: BeautifulSoup) -> list[Tag]:
         """Find story card containers."""
@@ -25,79 +31,94 @@ class InfobaeParser(BaseParser):
 
     def parse_article_element(self, element: Tag) -> ParsedArticleData | None:
         """Extract article data from a story-card-ctn element."""
-        title = self._extract_headline(element)
-        url = self._extract_url(element)
+        parts = self._collect_card_parts(element)
+        title = self._extract_headline(parts)
+        url = self._extract_url(element, parts)
         if not title or not url:
             return None
 
         return {
             "title": title,
             "url": url,
-            "summary": self._extract_summary(element),
-            "image_url": self._extract_image_url(element),
+            "summary": self._extract_summary(parts),
+            "image_url": self._extract_image_url(parts),
         }
 
-    def _extract_headline(self, element: Tag) -> str | None:
-        """Extract headline text from article element."""
-        h2 = element.find("h2", class_="story-card-hl")
-        if h2:
-            text: str = h2.get_text(strip=True)
-            if text:
-                return text
-
-        h2_fallback = element.find("h2")
-        if h2_fallback:
-            text = h2_fallback.get_text(strip=True)
-            if text:
-                return text
+    def _collect_card_parts(self, element: Tag) -> dict[str, Tag]:
+        """Collect the card's links, headings and images in one walk.
+
+        Keys: "link" (first a[href]), "hl" (first h2.story-card-hl),
+        "h2" (first h2), "deck" (first h3.story-card-deck),
+        "card_img" (first img.story-card-img) and "img" (first img).
+        """
+        parts: dict[str, Tag] = {}
+        for node in element.find_all(["a", "h2", "h3", "img"]):
+            if not isinstance(node, Tag):
+                continue
+            classes = node.get("class") or []
+            if node.name == "a":
+                if node.get("href") is not None:
+                    parts.setdefault("link", node)
+            elif node.name == "h2":
+                parts.setdefault("h2", node)
+                if "story-card-hl" in classes:
+                    parts.setdefault("hl", node)
+            elif node.name == "h3":
+                if "story-card-deck" in classes:
+                    parts.setdefault("deck", node)
+            else:
+                parts.setdefault("img", node)
+                if "story-card-img" in classes:
+                    parts.setdefault("card_img", node)
+        return parts
+
+    def _extract_headline(self, parts: dict[str, Tag]) -> str | None:
+        """Extract headline text, preferring h2.story-card-hl over any h2."""
+        for key in ("hl", "h2"):
+            heading = parts.get(key)
+            if heading is not None:
+                text = node_text(heading)
+                if text:
+                    return text
 
         return None
 
-    def _extract_url(self, element: Tag) -> str | None:
-        """Extract article URL from element."""
+    def _extract_url(self, element: Tag, parts: dict[str, Tag]) -> str | None:
+        """Extract article URL from the card itself or its first link."""
         href = element.get("href")
         if href and isinstance(href, str):
             resolved = resolve_url(self.base_url, self.allowed_hosts, href)
             if resolved:
                 return resolved
 
-        link = element.find("a", href=True)
-        if link:
+        link = parts.get("link")
+        if link is not None:
             href = link.get("href")
             if href and isinstance(href, str):
                 return resolve_url(self.base_url, self.allowed_hosts, href)
 
         return None
 
-    def _extract_summary(self, element: Tag) -> str | None:
+    def _extract_summary(self, parts: dict[str, Tag]) -> str | None:
         """Extract summary/deck from article element."""
-        deck = element.find("h3", class_="story-card-deck")
-        if deck:
-            text: str = deck.get_text(strip=True)
+        deck = parts.get("deck")
+        if deck is not None:
+            text = node_text(deck)
             if text:
                 return text
         return None
 
-    def _extract_image_url(self, element: Tag) -> str | None:
-        """Extract image URL from article element."""
-        img = element.find("img", class_="story-card-img")
-        if not img:
-            img = element.find("img")
+    def _extract_image_url(self, parts: dict[str, Tag]) -> str | None:
+        """Extract image URL, preferring img.story-card-img over any img."""
+        img = parts.get("card_img") or parts.get("img")
 
-        if img and isinstance(img, Tag):
+        if img is not None:
             for attr in ("data-src", "data-srcset", "srcset", "src"):
                 value = img.get(attr)
                 if value and isinstance(value, str):
                     url = first_srcset_url(value) if "srcset" in attr else value
-                    if url:
+                    # Skip data URIs (inline placeholders)
+                    if url and not url.startswith("data:"):
                         return self._resolve_image_url(url)
 
         return None
-
-    def _resolve_image_url(self, url: str) -> str:
-        """Resolve potentially relative image URL to absolute."""
-        if url.startswith("//"):
-            return f"https:{url}"
-        if url.startswith("/"):
-            return urljoin(self.base_url, url)
-        return url
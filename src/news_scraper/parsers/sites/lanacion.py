@@ -3,13 +3,17 @@
 from __future__ import annotations
 
 from typing import cast
-from urllib.parse import urljoin
 
 from bs4 import BeautifulSoup, Tag
 
 from news_scraper.parsers.base import BaseParser, ParsedArticleData
 from news_scraper.parsers.registry import register_parser
-from news_scraper.parsers.utils import first_srcset_url, resolve_url
+from news_scraper.parsers.utils import (
+    class_strainer,
+    first_srcset_url,
+    node_text,
+    resolve_url,
+)
 
 
 @register_parser("lanacion")
@@ -17,7 +21,9 @@ class LaNacionParser(BaseParser):
     """Parser for La Nacion front page HTML."""
 
     base_url = "https://www.lanacion.com.ar"
-    allowed_hosts = {"www.lanacion.com.ar", "lanacion.com.ar"}
+    allowed_hosts = frozenset({"www.lanacion.com.ar", "lanacion.com.ar"})
+    parse_only = class_strainer("ln-card", "article")
+    html_marker = "ln-card"
 
     def iter_article_elements(self, soup: BeautifulSoup) -> list[Tag]:
         """Find article cards with ln-card class."""
@@ -25,91 +31,98 @@ class LaNacionParser(BaseParser):
 
     def parse_article_element(self, element: Tag) -> ParsedArticleData | None:
         """Extract article data from an ln-card article element."""
-        url = self._extract_url(element)
-        title = self._extract_headline(element)
+        parts = self._collect_card_parts(element)
+        url = self._extract_url(parts)
+        title = self._extract_headline(parts)
         if not title or not url:
             return None
 
         return {
             "title": title,
             "url": url,
-            "summary": self._extract_summary(element),
-            "image_url": self._extract_image_url(element),
+            "summary": self._extract_summary(parts),
+            "image_url": self._extract_image_url(parts),
         }
 
-    def _extract_url(self, element: Tag) -> str | None:
-        """Extract article URL from element."""
-        link = element.find("a", class_="ln-link")
-        if link and isinstance(link, Tag):
+    def _collect_card_parts(self, element: Tag) -> dict[str, Tag]:
+        """Collect the card's links, headings and image in a single walk.
+
+        Keys: "ln_link" (first a.ln-link), "link" (first a[href]), the first
+        "h1", "h2" and "h3", and "img" (first img).
+        """
+        parts: dict[str, Tag] = {}
+        for node in element.find_all(["a", "h1", "h2", "h3", "img"]):
+            if not isinstance(node, Tag):
+                continue
+            if node.name == "a":
+                if "ln-link" in (node.get("class") or []):
+                    parts.setdefault("ln_link", node)
+                if node.get("href") is not None:
+                    parts.setdefault("link", node)
+            else:
+                parts.setdefault(node.name, node)
+        return parts
+
+    def _extract_url(self, parts: dict[str, Tag]) -> str | None:
+        """Extract article URL, preferring the a.ln-link card link."""
+        link = parts.get("ln_link")
+        if link is not None:
             href = link.get("href")
             if href and isinstance(href, str):
                 resolved = resolve_url(self.base_url, self.allowed_hosts, href)
                 if resolved:
                     return resolved
 
-        link = element.find("a", href=True)
-        if link and isinstance(link, Tag):
+        link = parts.get("link")
+        if link is not None:
             href = link.get("href")
             if href and isinstance(href, str):
                 return resolve_url(self.base_url, self.allowed_hosts, href)
 
         return None
 
-    def _extract_headline(self, element: Tag) -> str | None:
-        """Extract headline text from article element."""
-        h1 = element.find("h1")
-        if h1:
-            text = (h1.get_text(strip=False) or "").strip()
-            if text:
-                return text
-
-        h2 = element.find("h2")
-        if h2:
-            text = (h2.get_text(strip=False) or "").strip()
-            if text:
-                return text
+    def _extract_headline(self, parts: dict[str, Tag]) -> str | None:
+        """Extract headline text, preferring h1 over h2."""
+        for name in ("h1", "h2"):
+            heading = parts.get(name)
+            if heading is not None:
+                text = node_text(heading)
+                if text:
+                    return text
 
         return None
 
-    def _extract_summary(self, element: Tag) -> str | None:
-        """Extract summary from article element."""
-        h1 = element.find("h1")
-        h2 = element.find("h2")
-        if h1 and h2:
-            text: str = h2.get_text(strip=True)
+    def _extract_summary(self, parts: dict[str, Tag]) -> str | None:
+        """Extract summary: h2 when an h1 holds the headline, else h3."""
+        h2 = parts.get("h2")
+        if "h1" in parts and h2 is not None:
+            text = node_text(h2)
             if text:
                 return text
 
-        h3 = element.find("h3")
-        if h3:
-            text = h3.get_text(strip=True)
+        h3 = parts.get("h3")
+        if h3 is not None:
+            text = node_text(h3)
             if text:
                 return text
 
         return None
 
-    def _extract_image_url(self, element: Tag) -> str | None:
-        """Extract image URL from article element."""
-        img = element.find("img")
-        if img and isinstance(img, Tag):
+    def _extract_image_url(self, parts: dict[str, Tag]) -> str | None:
+        """Extract image URL from the card's first img."""
+        img = parts.get("img")
+        if img is not None:
             for attr in ("src", "data-src"):
                 src = img.get(attr)
-                if src and isinstance(src, str):
+                # Skip data URIs (inline placeholders)
+                if src and isinstance(src, str) and not src.startswith("data:"):
                     return self._resolve_image_url(src)
 
             for attr in ("srcset", "data-srcset"):
                 srcset = img.get(attr)
                 if srcset and isinstance(srcset, str):
                     candidate = first_srcset_url(srcset)
-                    if candidate:
+                    if candidate and not candidate.startswith("data:"):
                         return self._resolve_image_url(candidate)
 
         return None
-
-    def _resolve_image_url(self, url: str) -> str:
-        """Resolve potentially relative image URL to absolute."""
-        if url.startswith("//"):
-            return f"https:{url}"
-        if url.startswith("/"):
-            return urljoin(self.base_url, url)
-        return url
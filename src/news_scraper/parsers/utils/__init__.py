@@ -1,6 +1,8 @@
 """Shared parser utilities."""
 
 from news_scraper.parsers.utils.images import first_srcset_url
+from news_scraper.parsers.utils.soup import class_strainer
+from news_scraper.parsers.utils.text import node_text
 from news_scraper.parsers.utils.url import resolve_url
 
-__all__ = ["first_srcset_url", "resolve_url"]
+__all__ = ["class_strainer", "first_srcset_url", "node_text", "resolve_url"]
@@ -0,0 +1,18 @@
+"""Soup construction helpers for parsers."""
+
+from __future__ import annotations
+
+import re
+
+from bs4 import SoupStrainer
+
+
+def class_strainer(class_name: str, tag_name: str | None = None) -> SoupStrainer:
+    """Return a SoupStrainer keeping tags whose class list includes class_name.
+
+    While parsing, bs4 matches `class_` against the raw attribute string
+    (e.g. "card featured"), so a plain `class_="card"` would drop tags with
+    extra classes. Match the class as a whitespace-separated token instead.
+    """
+    pattern = re.compile(rf"(?:^|\s){re.escape(class_name)}(?:\s|$)")
+    return SoupStrainer(tag_name, class_=pattern)
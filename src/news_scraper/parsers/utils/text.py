@@ -0,0 +1,19 @@
+"""Text helpers for parsers."""
+
+from __future__ import annotations
+
+import re
+
+from bs4 import Tag
+
+_WS_RE = re.compile(r"\s+")
+
+
+def node_text(node: Tag) -> str:
+    """Return the text of a node with whitespace collapsed.
+
+    Joins the raw text segments so spacing between siblings (e.g.
+    `<span>Prefix. </span>Rest`) is kept, then collapses runs of whitespace
+    into single spaces and trims the ends.
+    """
+    return _WS_RE.sub(" ", "".join(node.strings)).strip()
@@ -2,10 +2,17 @@
 
 from __future__ import annotations
 
+import re
+from collections.abc import Set as AbstractSet
+from functools import lru_cache
 from urllib.parse import urljoin, urlparse
 
+_ABSOLUTE_HTTP_RE = re.compile(r"https?://[^/?#]", re.IGNORECASE)
 
-def resolve_url(base_url: str, allowed_hosts: set[str], href: str) -> str | None:
+
+def resolve_url(
+    base_url: str, allowed_hosts: AbstractSet[str], href: str
+) -> str | None:
     """Resolve and normalize an article URL.
 
     Rules:
@@ -19,6 +26,21 @@ def resolve_url(base_url: str, allowed_hosts: set[str], href: str) -> str | None
     if not stripped or stripped.startswith("#"):
         return None
 
+    return _resolve_stripped_url(base_url, frozenset(allowed_hosts), stripped)
+
+
+@lru_cache(maxsize=4096)
+def _resolve_stripped_url(
+    base_url: str, hosts: frozenset[str], stripped: str
+) -> str | None:
+    """Resolve a stripped, non-fragment href (see resolve_url).
+
+    Cached because pages repeat the same hrefs (card link plus headline
+    link, "most read" boxes) and the result depends only on the inputs.
+    """
+    if _is_external_absolute_url(stripped, hosts):
+        return None
+
     resolved = urljoin(base_url, stripped)
     parsed = urlparse(resolved)
 
@@ -26,8 +48,7 @@ def resolve_url(base_url: str, allowed_hosts: set[str], href: str) -> str | None
         return None
 
     host = parsed.netloc.lower()
-    allowed = {h.lower() for h in allowed_hosts}
-    if not _is_allowed_host(host, allowed):
+    if not _is_allowed_host(host, hosts):
         return None
 
     if not parsed.path or parsed.path == "/":
@@ -36,8 +57,39 @@ def resolve_url(base_url: str, allowed_hosts: set[str], href: str) -> str | None
     return parsed._replace(query="", fragment="").geturl()
 
 
-def _is_allowed_host(host: str, allowed_hosts: set[str]) -> bool:
+def _is_external_absolute_url(href: str, allowed_hosts: frozenset[str]) -> bool:
+    """Cheaply reject absolute links to other sites before urljoin/urlparse."""
+    return bool(_ABSOLUTE_HTTP_RE.match(href)) and not _allowed_url_re(
+        allowed_hosts
+    ).match(href)
+
+
+def _is_allowed_host(host: str, allowed_hosts: frozenset[str]) -> bool:
     """Check if host is allowed; subdomains are accepted."""
-    if host in allowed_hosts:
-        return True
-    return any(host.endswith(f".{allowed}") for allowed in allowed_hosts)
+    exact, suffixes = _host_matchers(allowed_hosts)
+    return host in exact or host.endswith(suffixes)
+
+
+@lru_cache(maxsize=32)
+def _host_matchers(
+    allowed_hosts: frozenset[str],
+) -> tuple[frozenset[str], tuple[str, ...]]:
+    """Return lowercased allowed hosts and their subdomain suffixes.
+
+    Cached per host set, so each parser's set is normalized only once.
+    """
+    exact = frozenset(host.lower() for host in allowed_hosts)
+    return exact, tuple(f".{host}" for host in exact)
+
+
+@lru_cache(maxsize=32)
+def _allowed_url_re(allowed_hosts: frozenset[str]) -> re.Pattern[str]:
+    """Compile a matcher for absolute http(s) URLs on an allowed host.
+
+    Mirrors _is_allowed_host (exact host or any subdomain, no port or
+    userinfo) so it only rejects URLs the full check would reject too.
+    """
+    hosts = "|".join(re.escape(host) for host in sorted(allowed_hosts))
+    return re.compile(
+        rf"https?://(?:[^/?#@:]*\.)?(?:{hosts})(?:[/?#]|$)", re.IGNORECASE
+    )
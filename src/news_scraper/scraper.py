@@ -34,7 +34,7 @@ class ScraperError(Exception):
         super().__init__(message)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ScrapeResult:
     """Result of a scrape operation.
 
@@ -142,11 +142,12 @@ def format_article(article: ParsedArticle, index: int) -> str:
     return "\n".join(lines)
 
 
-def print_scrape_result(result: ScrapeResult) -> None:
+def print_scrape_result(result: ScrapeResult, console: Console = console) -> None:
     """Print scrape result to console in a readable format.
 
     Args:
         result: Scrape result to print.
+        console: Console to print to. Defaults to the module console (stdout).
     """
     if not result.articles:
         console.print("No articles found.")
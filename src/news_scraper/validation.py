@@ -4,7 +4,7 @@ import re
 
 # Slug pattern: lowercase alphanumeric, hyphens, underscores
 # Must start with letter or number
-SLUG_PATTERN = re.compile(r"^[a-z0-9][a-z0-9_-]*$")
+SLUG_PATTERN = re.compile(r"[a-z0-9][a-z0-9_-]*")
 SLUG_MAX_LENGTH = 100
 
 
@@ -33,13 +33,14 @@ def validate_slug(value: str, field_name: str = "value") -> str:
     if not value:
         raise ValidationError(field_name, "cannot be empty")
 
+    # Check length first so oversized input is never lowercased or matched
+    if len(value) > SLUG_MAX_LENGTH:
+        raise ValidationError(field_name, f"cannot exceed {SLUG_MAX_LENGTH} characters")
+
     # Normalize to lowercase
     normalized = value.lower()
 
-    if len(normalized) > SLUG_MAX_LENGTH:
-        raise ValidationError(field_name, f"cannot exceed {SLUG_MAX_LENGTH} characters")
-
-    if not SLUG_PATTERN.match(normalized):
+    if not SLUG_PATTERN.fullmatch(normalized):
         raise ValidationError(
             field_name,
             "must contain only lowercase letters, numbers, hyphens, and underscores, "
@@ -58,8 +59,6 @@ def is_valid_slug(value: str) -> bool:
     Returns:
         True if valid, False otherwise.
     """
-    try:
-        validate_slug(value)
-        return True
-    except ValidationError:
+    if not value or len(value) > SLUG_MAX_LENGTH:
         return False
+    return SLUG_PATTERN.fullmatch(value.lower()) is not None
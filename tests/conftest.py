@@ -4,10 +4,10 @@ from collections.abc import Generator
 
 import pytest
 from sqlalchemy import create_engine
-from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.orm import Session
 
 from news_scraper.db.base import Base
-from news_scraper.db.models import Source  # noqa: F401 - registers model
+from news_scraper.db.models import Source
 
 
 @pytest.fixture
@@ -15,10 +15,17 @@ def db_session() -> Generator[Session, None, None]:
     """In-memory database session for testing."""
     engine = create_engine("sqlite:///:memory:")
     Base.metadata.create_all(engine)
-    TestSession = sessionmaker(bind=engine)
-    session = TestSession()
+    session = Session(bind=engine)
     try:
         yield session
     finally:
         session.close()
-        Base.metadata.drop_all(engine)
+        engine.dispose()
+
+
+@pytest.fixture
+def infobae_source() -> Source:
+    """Transient Infobae source with a fixed id, not attached to a session."""
+    source = Source(name="infobae", url="https://www.infobae.com")
+    source.id = 1
+    return source
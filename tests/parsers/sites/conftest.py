@@ -0,0 +1,25 @@
+"""Shared fixtures for site parser tests."""
+
+from pathlib import Path
+
+import pytest
+
+FIXTURES_DIR = Path(__file__).parents[2] / "fixtures"
+
+
+@pytest.fixture(scope="session")
+def infobae_html() -> bytes:
+    """Load real Infobae HTML fixture once per session."""
+    return (FIXTURES_DIR / "infobae_sample.html").read_bytes()
+
+
+@pytest.fixture(scope="session")
+def lanacion_html() -> bytes:
+    """Load real La Nacion HTML fixture once per session."""
+    return (FIXTURES_DIR / "lanacion_sample.html").read_bytes()
+
+
+@pytest.fixture(scope="session")
+def lapoliticaonline_html() -> bytes:
+    """Load real La Política Online HTML fixture once per session."""
+    return (FIXTURES_DIR / "lapoliticaonline_sample.html").read_bytes()
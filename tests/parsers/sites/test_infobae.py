@@ -2,16 +2,15 @@
 
 from __future__ import annotations
 
-from pathlib import Path
-
 import pytest
 
+from news_scraper.parsers.base import ParsedArticle
 from news_scraper.parsers.sites.infobae import InfobaeParser
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def parser() -> InfobaeParser:
-    """Create parser instance for tests."""
+    """Create one stateless parser instance shared by this module's tests."""
     return InfobaeParser()
 
 
@@ -90,6 +89,24 @@ class TestInfobaeParser:
         assert len(result) == 1
         assert result[0].image_url == "https://example.com/image.jpg"
 
+    def test_parse_story_card_with_extra_card_classes(
+        self, parser: InfobaeParser
+    ) -> None:
+        """Test cards whose container has extra classes are still parsed."""
+        html = """
+        <html>
+        <body>
+            <a class="story-card-ctn featured" href="/article/">
+                <h2 class="story-card-hl">Test</h2>
+            </a>
+        </body>
+        </html>
+        """
+        result = parser.parse(html)
+
+        assert len(result) == 1
+        assert result[0].headline == "Test"
+
     def test_parse_skips_card_without_headline(self, parser: InfobaeParser) -> None:
         """Test that cards without headlines are skipped."""
         html = """
@@ -288,34 +305,55 @@ class TestInfobaeParser:
         assert len(result) == 1
         assert result[0].image_url == "https://ex.co/1x.jpg"
 
+    def test_parse_skips_data_uri_placeholder(self, parser: InfobaeParser) -> None:
+        """Test that a data URI placeholder falls through to the real src."""
+        html = """
+        <html>
+        <body>
+            <a class="story-card-ctn" href="/article/">
+                <h2 class="story-card-hl">Placeholder Test</h2>
+                <img class="story-card-img"
+                     data-src="data:image/gif;base64,R0lGODlhAQABAAAAACw="
+                     src="https://ex.co/real.jpg">
+            </a>
+        </body>
+        </html>
+        """
+        result = parser.parse(html)
+
+        assert len(result) == 1
+        assert result[0].image_url == "https://ex.co/real.jpg"
 
-class TestInfobaeParserRealHtml:
-    """Integration tests using real HTML fixture from Infobae."""
 
-    @pytest.fixture
-    def parser(self) -> InfobaeParser:
-        """Create parser instance for tests."""
-        return InfobaeParser()
+@pytest.fixture(scope="module")
+def real_articles(parser: InfobaeParser, infobae_html: bytes) -> list[ParsedArticle]:
+    """Parse the real fixture once; ParsedArticle is frozen, so sharing is safe."""
+    return parser.parse(infobae_html)
+
 
-    @pytest.fixture
-    def infobae_html(self) -> str:
-        """Load real Infobae HTML fixture."""
-        fixture_path = Path(__file__).parents[2] / "fixtures" / "infobae_sample.html"
-        return fixture_path.read_text(encoding="utf-8")
+class TestInfobaeParserRealHtml:
+    """Integration tests using real HTML fixture from Infobae."""
 
     def test_parse_real_html_extracts_articles(
-        self, parser: InfobaeParser, infobae_html: str
+        self, real_articles: list[ParsedArticle]
     ) -> None:
         """Test parsing real Infobae HTML extracts articles."""
-        result = parser.parse(infobae_html)
-        assert len(result) > 0
+        assert len(real_articles) > 0
+
+    def test_parse_real_html_bytes_matches_text(
+        self,
+        parser: InfobaeParser,
+        infobae_html: bytes,
+        real_articles: list[ParsedArticle],
+    ) -> None:
+        """Test parsing raw UTF-8 bytes yields the same articles as text."""
+        assert real_articles == parser.parse(infobae_html.decode("utf-8"))
 
     def test_parse_real_html_first_article_has_fields(
-        self, parser: InfobaeParser, infobae_html: str
+        self, real_articles: list[ParsedArticle]
     ) -> None:
         """Test first article from real HTML has expected data."""
-        result = parser.parse(infobae_html)
-        first = result[0]
+        first = real_articles[0]
 
         assert first.headline
         assert first.url.startswith("https://www.infobae.com/")
@@ -2,16 +2,15 @@
 
 from __future__ import annotations
 
-from pathlib import Path
-
 import pytest
 
+from news_scraper.parsers.base import ParsedArticle
 from news_scraper.parsers.sites.lanacion import LaNacionParser
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def parser() -> LaNacionParser:
-    """Create parser instance for tests."""
+    """Create one stateless parser instance shared by this module's tests."""
     return LaNacionParser()
 
 
@@ -142,6 +141,52 @@ class TestLaNacionParser:
         assert len(result) == 1
         assert result[0].image_url == "https://www.lanacion.com.ar/resizer/image.jpg"
 
+    def test_parse_card_with_extra_classes(self, parser: LaNacionParser) -> None:
+        """Test cards with additional classes survive the ln-card strainer."""
+        html = """
+        <html>
+        <body>
+            <h2>Outside any card</h2>
+            <article class="mod-article ln-card --featured">
+                <a class="link ln-link" href="/article/">
+                    <h2>Featured Article</h2>
+                </a>
+            </article>
+        </body>
+        </html>
+        """
+        result = parser.parse(html)
+
+        assert len(result) == 1
+        assert result[0].headline == "Featured Article"
+
+    def test_parse_skips_data_uri_images(self, parser: LaNacionParser) -> None:
+        """Test that data URI images are skipped in favor of lazy sources."""
+        html = """
+        <html>
+        <body>
+            <article class="ln-card">
+                <a class="link ln-link" href="/article/">
+                    <img src="data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAA..."
+                         data-src="/resizer/lazy.jpg">
+                    <h2>Article with Placeholder</h2>
+                </a>
+            </article>
+            <article class="ln-card">
+                <a class="link ln-link" href="/other/">
+                    <img src="data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAA...">
+                    <h2>Article with Only Placeholder</h2>
+                </a>
+            </article>
+        </body>
+        </html>
+        """
+        result = parser.parse(html)
+
+        assert len(result) == 2
+        assert result[0].image_url == "https://www.lanacion.com.ar/resizer/lazy.jpg"
+        assert result[1].image_url is None
+
     def test_parse_skips_card_without_headline(self, parser: LaNacionParser) -> None:
         """Test that cards without headlines are skipped."""
         html = """
@@ -317,33 +362,26 @@ class TestLaNacionParser:
         assert result[0].url == "https://www.lanacion.com.ar/article/"
 
 
-class TestLaNacionParserRealHtml:
-    """Integration tests using real HTML fixture from La Nacion."""
+@pytest.fixture(scope="module")
+def real_articles(parser: LaNacionParser, lanacion_html: bytes) -> list[ParsedArticle]:
+    """Parse the real fixture once; ParsedArticle is frozen, so sharing is safe."""
+    return parser.parse(lanacion_html)
 
-    @pytest.fixture
-    def parser(self) -> LaNacionParser:
-        """Create parser instance for tests."""
-        return LaNacionParser()
 
-    @pytest.fixture
-    def lanacion_html(self) -> str:
-        """Load real La Nacion HTML fixture."""
-        fixture_path = Path(__file__).parents[2] / "fixtures" / "lanacion_sample.html"
-        return fixture_path.read_text(encoding="utf-8")
+class TestLaNacionParserRealHtml:
+    """Integration tests using real HTML fixture from La Nacion."""
 
     def test_parse_real_html_extracts_articles(
-        self, parser: LaNacionParser, lanacion_html: str
+        self, real_articles: list[ParsedArticle]
     ) -> None:
         """Test parsing real La Nacion HTML extracts articles."""
-        result = parser.parse(lanacion_html)
-        assert len(result) > 0
+        assert len(real_articles) > 0
 
     def test_parse_real_html_first_article_has_fields(
-        self, parser: LaNacionParser, lanacion_html: str
+        self, real_articles: list[ParsedArticle]
     ) -> None:
         """Test first article from real HTML has expected data."""
-        result = parser.parse(lanacion_html)
-        first = result[0]
+        first = real_articles[0]
 
         assert first.headline
         assert first.url.startswith("https://www.lanacion.com.ar/")
@@ -2,16 +2,15 @@
 
 from __future__ import annotations
 
-from pathlib import Path
-
 import pytest
 
+from news_scraper.parsers.base import ParsedArticle
 from news_scraper.parsers.sites.lapoliticaonline import LaPoliticaOnlineParser
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def parser() -> LaPoliticaOnlineParser:
-    """Create parser instance for tests."""
+    """Create one stateless parser instance shared by this module's tests."""
     return LaPoliticaOnlineParser()
 
 
@@ -271,11 +270,6 @@ class TestLaPoliticaOnlineParser:
 class TestLaPoliticaOnlineParserHelpers:
     """Tests for LaPoliticaOnlineParser helper methods."""
 
-    @pytest.fixture
-    def parser(self) -> LaPoliticaOnlineParser:
-        """Create parser instance for helper tests."""
-        return LaPoliticaOnlineParser()
-
     def test_resolve_image_url_absolute(self, parser: LaPoliticaOnlineParser) -> None:
         """Test resolving absolute image URL."""
         url = "https://cdn.lapoliticaonline.com/image.jpg"
@@ -296,6 +290,22 @@ class TestLaPoliticaOnlineParserHelpers:
         result = parser._resolve_image_url(url)
         assert result == "https://cdn.lapoliticaonline.com/image.jpg"
 
+    def test_resolve_image_url_path_relative(
+        self, parser: LaPoliticaOnlineParser
+    ) -> None:
+        """Test resolving path-relative image URL against the base URL."""
+        url = "files/image/photo.jpg"
+        result = parser._resolve_image_url(url)
+        assert result == "https://www.lapoliticaonline.com/files/image/photo.jpg"
+
+
+@pytest.fixture(scope="module")
+def real_articles(
+    parser: LaPoliticaOnlineParser, lapoliticaonline_html: bytes
+) -> list[ParsedArticle]:
+    """Parse the real fixture once; ParsedArticle is frozen, so sharing is safe."""
+    return parser.parse(lapoliticaonline_html)
+
 
 class TestLaPoliticaOnlineParserRealHtml:
     """Integration tests using real HTML fixture from La Política Online."""
@@ -306,90 +316,61 @@ class TestLaPoliticaOnlineParserRealHtml:
     EXPECTED_ARTICLE_COUNT = 90  # Update to match fixture snapshot
     EXPECTED_WITH_IMAGES_COUNT = 11  # Update to match fixture snapshot
 
-    @pytest.fixture
-    def parser(self) -> LaPoliticaOnlineParser:
-        """Create parser instance for tests."""
-        return LaPoliticaOnlineParser()
-
-    @pytest.fixture
-    def lapoliticaonline_html(self) -> str:
-        """Load real La Política Online HTML fixture."""
-        fixture_path = (
-            Path(__file__).parent.parent.parent
-            / "fixtures"
-            / "lapoliticaonline_sample.html"
-        )
-        return fixture_path.read_text(encoding="utf-8")
-
     def test_parse_real_html_extracts_articles(
-        self, parser: LaPoliticaOnlineParser, lapoliticaonline_html: str
+        self, real_articles: list[ParsedArticle]
     ) -> None:
         """Test parsing real La Política Online HTML extracts expected articles."""
-        result = parser.parse(lapoliticaonline_html)
-
         # Fixture-based expectation: update constants when fixture changes
-        assert len(result) == self.EXPECTED_ARTICLE_COUNT
+        assert len(real_articles) == self.EXPECTED_ARTICLE_COUNT
 
     def test_parse_real_html_first_article(
-        self, parser: LaPoliticaOnlineParser, lapoliticaonline_html: str
+        self, real_articles: list[ParsedArticle]
     ) -> None:
         """Test first article from real HTML has expected data."""
-        result = parser.parse(lapoliticaonline_html)
-
-        if not result:
+        if not real_articles:
             pytest.skip("No articles found in fixture")
 
-        first = result[0]
+        first = real_articles[0]
         assert first.headline  # Has headline
         assert len(first.headline) > 10  # Non-trivial headline
         assert first.url.startswith("https://www.lapoliticaonline.com/")
         assert first.position == 1
 
     def test_parse_real_html_all_have_headlines(
-        self, parser: LaPoliticaOnlineParser, lapoliticaonline_html: str
+        self, real_articles: list[ParsedArticle]
     ) -> None:
         """Test all parsed articles have headlines."""
-        result = parser.parse(lapoliticaonline_html)
-
-        for article in result:
+        for article in real_articles:
             assert article.headline
             assert len(article.headline) > 5
 
     def test_parse_real_html_all_have_urls(
-        self, parser: LaPoliticaOnlineParser, lapoliticaonline_html: str
+        self, real_articles: list[ParsedArticle]
     ) -> None:
         """Test all parsed articles have valid URLs."""
-        result = parser.parse(lapoliticaonline_html)
-
-        for article in result:
+        for article in real_articles:
             assert article.url
             assert article.url.startswith("https://")
             assert "lapoliticaonline.com" in article.url
 
     def test_parse_real_html_no_duplicates(
-        self, parser: LaPoliticaOnlineParser, lapoliticaonline_html: str
+        self, real_articles: list[ParsedArticle]
     ) -> None:
         """Test no duplicate URLs in parsed results."""
-        result = parser.parse(lapoliticaonline_html)
-
-        urls = [article.url for article in result]
+        urls = [article.url for article in real_articles]
         assert len(urls) == len(set(urls))
 
     def test_parse_real_html_positions_sequential(
-        self, parser: LaPoliticaOnlineParser, lapoliticaonline_html: str
+        self, real_articles: list[ParsedArticle]
     ) -> None:
         """Test positions are sequential starting from 1."""
-        result = parser.parse(lapoliticaonline_html)
-
-        positions = [article.position for article in result]
-        expected = list(range(1, len(result) + 1))
+        positions = [article.position for article in real_articles]
+        expected = list(range(1, len(real_articles) + 1))
         assert positions == expected
 
     def test_parse_real_html_image_count_matches_fixture(
-        self, parser: LaPoliticaOnlineParser, lapoliticaonline_html: str
+        self, real_articles: list[ParsedArticle]
     ) -> None:
         """Test image count matches fixture snapshot."""
-        result = parser.parse(lapoliticaonline_html)
-
-        with_images = [a for a in result if a.image_url]
+        with_images = [a for a in real_articles if a.image_url]
         assert len(with_images) == self.EXPECTED_WITH_IMAGES_COUNT
@@ -6,10 +6,16 @@ from typing import cast
 from unittest.mock import MagicMock, patch
 
 import pytest
-from bs4 import BeautifulSoup, Tag
+from bs4 import BeautifulSoup, SoupStrainer, Tag
 
 from news_scraper.parsers.base import BaseParser, ParsedArticle, ParsedArticleData
-from news_scraper.parsers.utils import first_srcset_url, resolve_url
+from news_scraper.parsers.utils import (
+    class_strainer,
+    first_srcset_url,
+    node_text,
+    resolve_url,
+)
+from news_scraper.parsers.utils.url import _resolve_stripped_url
 
 
 class TestParsedArticle:
@@ -60,13 +66,18 @@ class TestParsedArticle:
         article_set = {article1, article2}
         assert len(article_set) == 1
 
+    def test_article_has_no_instance_dict(self) -> None:
+        """Test ParsedArticle uses slots instead of a per-instance __dict__."""
+        article = ParsedArticle(headline="Test", url="https://ex.com", position=1)
+        assert not hasattr(article, "__dict__")
+
 
 class _StubParser(BaseParser):
     """Minimal parser for BaseParser behavior tests."""
 
     source = "stub"
     base_url = "https://example.com"
-    allowed_hosts = {"example.com"}
+    allowed_hosts = frozenset({"example.com"})
 
     def iter_article_elements(self, soup: BeautifulSoup) -> list[Tag]:
         return cast(list[Tag], soup.find_all("article"))
@@ -139,6 +150,91 @@ class TestBaseParser:
         assert kwargs["source"] == "stub"
         assert kwargs["position"] == 1
 
+    def test_parse_only_restricts_tree_to_matching_subtrees(self) -> None:
+        """A parse_only strainer drops markup outside matching subtrees."""
+
+        class _StrainedParser(_StubParser):
+            parse_only = SoupStrainer("section")
+
+        html = """
+        <article data-title="Outside" data-href="/outside/"></article>
+        <section>
+            <article data-title="Inside" data-href="/inside/"></article>
+        </section>
+        """
+        result = _StrainedParser().parse(html)
+
+        assert [article.headline for article in result] == ["Inside"]
+
+    def test_build_soup_uses_parser_backend(self) -> None:
+        """build_soup hands parser_backend to BeautifulSoup."""
+
+        class _HtmlParserStub(_StubParser):
+            parser_backend = "html.parser"
+
+        assert _StubParser().build_soup("<p></p>").builder.NAME == "lxml"
+        assert _HtmlParserStub().build_soup("<p></p>").builder.NAME == "html.parser"
+
+    def test_parse_skips_documents_without_marker(self) -> None:
+        """Documents lacking html_marker are not parsed at all."""
+
+        class _MarkedParser(_StubParser):
+            html_marker = "data-title"
+
+        with patch.object(_MarkedParser, "build_soup") as mock_build_soup:
+            result = _MarkedParser().parse("<html><body><p>No cards</p></body></html>")
+
+        assert result == []
+        mock_build_soup.assert_not_called()
+
+    def test_parse_with_marker_present_parses_normally(self) -> None:
+        """Documents containing html_marker follow the regular workflow."""
+
+        class _MarkedParser(_StubParser):
+            html_marker = "data-title"
+
+        html = '<article data-title="One" data-href="/one/"></article>'
+        result = _MarkedParser().parse(html)
+
+        assert [article.headline for article in result] == ["One"]
+
+    def test_parse_accepts_utf8_bytes(self) -> None:
+        """Bytes input is decoded as UTF-8 and matches str parsing."""
+
+        class _MarkedParser(_StubParser):
+            html_marker = "data-title"
+
+        html = '<article data-title="Économía" data-href="/one/"></article>'
+        parser = _MarkedParser()
+
+        assert parser.parse(html.encode("utf-8")) == parser.parse(html)
+        assert parser.parse(html.encode("utf-8"))[0].headline == "Économía"
+        assert parser.parse(b"<p>No cards</p>") == []
+
+    def test_parse_many_preserves_document_order(self) -> None:
+        """parse_many returns one result list per document, in input order."""
+        htmls = [
+            '<article data-title="One" data-href="/one/"></article>',
+            "<p>No cards</p>",
+            '<article data-title="Two" data-href="/two/"></article>',
+        ]
+        parser = _StubParser()
+
+        result = parser.parse_many(htmls, max_workers=2)
+
+        assert result == [parser.parse(html) for html in htmls]
+        assert [len(articles) for articles in result] == [1, 0, 1]
+
+    def test_parse_many_single_document_runs_inline(self) -> None:
+        """A single document is parsed without starting a process pool."""
+        html = '<article data-title="One" data-href="/one/"></article>'
+
+        with patch("news_scraper.parsers.base.ProcessPoolExecutor") as mock_pool:
+            result = _StubParser().parse_many([html])
+
+        mock_pool.assert_not_called()
+        assert [articles[0].headline for articles in result] == ["One"]
+
 
 class TestResolveUrl:
     """Tests for resolve_url helper."""
@@ -165,6 +261,32 @@ class TestResolveUrl:
         )
         assert url == "https://news.example.com/path/"
 
+    def test_allowed_hosts_are_case_insensitive(self) -> None:
+        """Allowed hosts match regardless of case, for sets and frozensets."""
+        href = "https://WWW.Example.com/path/"
+        for hosts in ({"www.EXAMPLE.com"}, frozenset({"www.EXAMPLE.com"})):
+            url = resolve_url("https://example.com", hosts, href)
+            assert url == "https://WWW.Example.com/path/"
+
+    def test_rejects_lookalike_absolute_hosts(self) -> None:
+        """Absolute URLs on hosts that only resemble an allowed host are rejected."""
+        for href in (
+            "https://example.com.evil.com/path/",
+            "https://notexample.com/path/",
+            "http://evil.com/example.com/",
+        ):
+            assert resolve_url("https://example.com", {"example.com"}, href) is None
+
+    def test_repeated_href_is_served_from_cache(self) -> None:
+        """Resolving the same href twice reuses the cached result."""
+        href = "/cached-article/?utm=1"
+        first = resolve_url("https://example.com", {"example.com"}, href)
+        hits = _resolve_stripped_url.cache_info().hits
+        second = resolve_url("https://example.com", {"example.com"}, f" {href} ")
+
+        assert first == second == "https://example.com/cached-article/"
+        assert _resolve_stripped_url.cache_info().hits == hits + 1
+
 
 class TestFirstSrcsetUrl:
     """Tests for first_srcset_url helper."""
@@ -181,3 +303,48 @@ class TestFirstSrcsetUrl:
     def test_single_entry(self) -> None:
         """Handle a single srcset entry."""
         assert first_srcset_url(" https://ex.co/one.jpg ") == "https://ex.co/one.jpg"
+
+    def test_leading_empty_entry_returns_none(self) -> None:
+        """An empty first entry returns None."""
+        assert first_srcset_url(" , https://ex.co/two.jpg 2x") is None
+
+
+class TestClassStrainer:
+    """Tests for class_strainer helper."""
+
+    def test_keeps_tags_with_extra_classes(self) -> None:
+        """Tags listing the class among others are kept."""
+        html = '<p class="a card b">One</p><p class="card">Two</p><p>Three</p>'
+        soup = BeautifulSoup(html, "lxml", parse_only=class_strainer("card"))
+        assert [p.get_text() for p in soup.find_all("p")] == ["One", "Two"]
+
+    def test_ignores_class_prefixes(self) -> None:
+        """Classes that merely start with the name are not matched."""
+        html = '<p class="card-title">One</p>'
+        soup = BeautifulSoup(html, "lxml", parse_only=class_strainer("card"))
+        assert soup.find_all("p") == []
+
+    def test_restricts_tag_name(self) -> None:
+        """An optional tag name narrows the match."""
+        html = '<p class="card">One</p><div class="card">Two</div>'
+        soup = BeautifulSoup(html, "lxml", parse_only=class_strainer("card", "div"))
+        assert [tag.name for tag in soup.find_all(class_="card")] == ["div"]
+
+
+class TestNodeText:
+    """Tests for node_text helper."""
+
+    def test_keeps_space_between_siblings(self) -> None:
+        """Spacing between a span and sibling text is preserved."""
+        soup = BeautifulSoup('<h2><span>"X". </span>La Anmat</h2>', "lxml")
+        assert node_text(cast(Tag, soup.h2)) == '"X". La Anmat'
+
+    def test_collapses_whitespace(self) -> None:
+        """Inner whitespace runs collapse and ends are trimmed."""
+        soup = BeautifulSoup("<h2>\n  Breaking\n\n   <b>news</b>  </h2>", "lxml")
+        assert node_text(cast(Tag, soup.h2)) == "Breaking news"
+
+    def test_empty_node(self) -> None:
+        """Whitespace-only nodes yield an empty string."""
+        soup = BeautifulSoup("<h2>   </h2>", "lxml")
+        assert node_text(cast(Tag, soup.h2)) == ""
@@ -35,6 +35,12 @@ class TestGetParser:
         assert isinstance(get_parser("LAPOLITICAONLINE"), LaPoliticaOnlineParser)
         assert isinstance(get_parser("LaPoliticaOnline"), LaPoliticaOnlineParser)
 
+    def test_get_parser_reuses_instance(self) -> None:
+        """Test repeated lookups return the same stateless parser instance."""
+        parser = get_parser("infobae")
+        assert get_parser("infobae") is parser
+        assert get_parser("INFOBAE") is parser
+
     def test_get_parser_unknown_source(self) -> None:
         """Test getting parser for unknown source raises error."""
         with pytest.raises(ParserNotFoundError) as exc_info:
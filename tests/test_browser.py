@@ -1,176 +1,179 @@
 """Tests for the browser module."""
 
+from collections.abc import Iterator
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
-
-from news_scraper.browser import BrowserError, fetch_rendered_html
+from playwright.sync_api import Error as PlaywrightError
+
+from news_scraper.browser import (
+    CHROME_ARGS,
+    BrowserError,
+    _block_heavy_resources,
+    _pool,
+    fetch_rendered_html,
+)
+
+pytestmark = pytest.mark.browser
+
+
+@pytest.fixture(autouse=True)
+def reset_browser_pool() -> Iterator[None]:
+    """Drop any browser cached by the shared pool around each test."""
+    _pool.close()
+    yield
+    _pool.close()
+
+
+@pytest.fixture
+def pw_mocks() -> Iterator[SimpleNamespace]:
+    """Patch sync_playwright and wire browser, context and page mocks."""
+    with patch("news_scraper.browser.sync_playwright") as mock_pw:
+        playwright = mock_pw.return_value.start.return_value
+        browser, context, page = MagicMock(), MagicMock(), MagicMock()
+        page.content.return_value = "<html></html>"
+        playwright.chromium.launch.return_value = browser
+        browser.new_context.return_value = context
+        context.new_page.return_value = page
+        yield SimpleNamespace(
+            pw=mock_pw,
+            playwright=playwright,
+            chromium=playwright.chromium,
+            browser=browser,
+            context=context,
+            page=page,
+        )
 
 
 class TestFetchRenderedHtml:
     """Tests for fetch_rendered_html function."""
 
-    def test_returns_page_content(self) -> None:
+    def test_returns_page_content(self, pw_mocks: SimpleNamespace) -> None:
         """Test that page HTML content is returned."""
         mock_html = "<html><body>Test content</body></html>"
+        pw_mocks.page.content.return_value = mock_html
 
-        with patch("news_scraper.browser.sync_playwright") as mock_pw:
-            mock_browser = MagicMock()
-            mock_context = MagicMock()
-            mock_page = MagicMock()
-            mock_page.content.return_value = mock_html
-
-            mock_pw.return_value.__enter__.return_value.chromium.launch.return_value = (
-                mock_browser
-            )
-            mock_browser.new_context.return_value = mock_context
-            mock_context.new_page.return_value = mock_page
-
-            result = fetch_rendered_html("https://example.com")
-
-            assert result == mock_html
-            mock_page.goto.assert_called_once_with(
-                "https://example.com", timeout=30000, wait_until="domcontentloaded"
-            )
-            mock_page.wait_for_load_state.assert_called_once_with(
-                "networkidle", timeout=5000
-            )
-
-    def test_browser_closed_on_success(self) -> None:
-        """Test browser is closed after successful fetch."""
-        with patch("news_scraper.browser.sync_playwright") as mock_pw:
-            mock_browser = MagicMock()
-            mock_context = MagicMock()
-            mock_page = MagicMock()
-            mock_page.content.return_value = "<html></html>"
-
-            mock_pw.return_value.__enter__.return_value.chromium.launch.return_value = (
-                mock_browser
-            )
-            mock_browser.new_context.return_value = mock_context
-            mock_context.new_page.return_value = mock_page
+        result = fetch_rendered_html("https://example.com")
 
-            fetch_rendered_html("https://example.com")
+        assert result == mock_html
+        pw_mocks.page.goto.assert_called_once_with(
+            "https://example.com", timeout=30000, wait_until="domcontentloaded"
+        )
+        pw_mocks.page.wait_for_load_state.assert_called_once_with(
+            "networkidle", timeout=5000
+        )
 
-            mock_browser.close.assert_called_once()
+    def test_context_closed_on_success(self, pw_mocks: SimpleNamespace) -> None:
+        """Test browser context is closed after successful fetch."""
+        fetch_rendered_html("https://example.com")
 
-    def test_browser_closed_on_navigation_error(self) -> None:
-        """Test browser is closed even when navigation fails."""
-        with patch("news_scraper.browser.sync_playwright") as mock_pw:
-            mock_browser = MagicMock()
-            mock_context = MagicMock()
-            mock_page = MagicMock()
+        pw_mocks.context.close.assert_called_once()
 
-            # Import PlaywrightError to raise it
-            from playwright.sync_api import Error as PlaywrightError
+    def test_context_closed_on_navigation_error(
+        self, pw_mocks: SimpleNamespace
+    ) -> None:
+        """Test browser context is closed even when navigation fails."""
+        pw_mocks.page.goto.side_effect = PlaywrightError("Navigation failed")
 
-            mock_page.goto.side_effect = PlaywrightError("Navigation failed")
+        with pytest.raises(BrowserError, match="Navigation failed"):
+            fetch_rendered_html("https://example.com")
 
-            mock_pw.return_value.__enter__.return_value.chromium.launch.return_value = (
-                mock_browser
-            )
-            mock_browser.new_context.return_value = mock_context
-            mock_context.new_page.return_value = mock_page
+        pw_mocks.context.close.assert_called_once()
 
-            with pytest.raises(BrowserError, match="Navigation failed"):
-                fetch_rendered_html("https://example.com")
+    def test_custom_timeout(self, pw_mocks: SimpleNamespace) -> None:
+        """Test custom timeout is passed to page.goto."""
+        fetch_rendered_html("https://example.com", timeout=60000)
 
-            mock_browser.close.assert_called_once()
+        pw_mocks.page.goto.assert_called_once_with(
+            "https://example.com", timeout=60000, wait_until="domcontentloaded"
+        )
+        pw_mocks.page.wait_for_load_state.assert_called_once_with(
+            "networkidle", timeout=5000
+        )
 
-    def test_custom_timeout(self) -> None:
-        """Test custom timeout is passed to page.goto."""
-        with patch("news_scraper.browser.sync_playwright") as mock_pw:
-            mock_browser = MagicMock()
-            mock_context = MagicMock()
-            mock_page = MagicMock()
-            mock_page.content.return_value = "<html></html>"
-
-            mock_pw.return_value.__enter__.return_value.chromium.launch.return_value = (
-                mock_browser
-            )
-            mock_browser.new_context.return_value = mock_context
-            mock_context.new_page.return_value = mock_page
-
-            fetch_rendered_html("https://example.com", timeout=60000)
-
-            mock_page.goto.assert_called_once_with(
-                "https://example.com", timeout=60000, wait_until="domcontentloaded"
-            )
-            mock_page.wait_for_load_state.assert_called_once_with(
-                "networkidle", timeout=5000
-            )
-
-    def test_launches_chrome_headless(self) -> None:
+    def test_launches_chrome_headless(self, pw_mocks: SimpleNamespace) -> None:
         """Test browser launches Chrome in headless mode."""
-        with patch("news_scraper.browser.sync_playwright") as mock_pw:
-            mock_browser = MagicMock()
-            mock_context = MagicMock()
-            mock_page = MagicMock()
-            mock_page.content.return_value = "<html></html>"
+        fetch_rendered_html("https://example.com")
 
-            mock_chromium = mock_pw.return_value.__enter__.return_value.chromium
-            mock_chromium.launch.return_value = mock_browser
-            mock_browser.new_context.return_value = mock_context
-            mock_context.new_page.return_value = mock_page
+        pw_mocks.chromium.launch.assert_called_once_with(
+            headless=True, channel="chrome", args=list(CHROME_ARGS)
+        )
+        assert "--disable-dev-shm-usage" in CHROME_ARGS
+        assert "--no-sandbox" not in CHROME_ARGS
 
-            fetch_rendered_html("https://example.com")
+    def test_sets_custom_user_agent(self, pw_mocks: SimpleNamespace) -> None:
+        """Test browser context is created with custom user agent."""
+        fetch_rendered_html("https://example.com")
 
-            mock_chromium.launch.assert_called_once_with(
-                headless=True, channel="chrome"
-            )
+        # Verify new_context was called with a user_agent parameter
+        pw_mocks.browser.new_context.assert_called_once()
+        call_kwargs = pw_mocks.browser.new_context.call_args.kwargs
+        assert "user_agent" in call_kwargs
+        assert "Mozilla/5.0" in call_kwargs["user_agent"]
 
-    def test_sets_custom_user_agent(self) -> None:
-        """Test browser context is created with custom user agent."""
-        with patch("news_scraper.browser.sync_playwright") as mock_pw:
-            mock_browser = MagicMock()
-            mock_context = MagicMock()
-            mock_page = MagicMock()
-            mock_page.content.return_value = "<html></html>"
-
-            mock_pw.return_value.__enter__.return_value.chromium.launch.return_value = (
-                mock_browser
-            )
-            mock_browser.new_context.return_value = mock_context
-            mock_context.new_page.return_value = mock_page
+    def test_browser_error_on_launch_failure(self, pw_mocks: SimpleNamespace) -> None:
+        """Test BrowserError is raised when browser launch fails."""
+        pw_mocks.chromium.launch.side_effect = PlaywrightError(
+            "Browser executable not found"
+        )
 
+        with pytest.raises(BrowserError, match="Browser executable not found"):
             fetch_rendered_html("https://example.com")
 
-            # Verify new_context was called with a user_agent parameter
-            mock_browser.new_context.assert_called_once()
-            call_kwargs = mock_browser.new_context.call_args.kwargs
-            assert "user_agent" in call_kwargs
-            assert "Mozilla/5.0" in call_kwargs["user_agent"]
+    def test_browser_error_on_content_failure(self, pw_mocks: SimpleNamespace) -> None:
+        """Test BrowserError is raised when page.content() fails."""
+        pw_mocks.page.content.side_effect = PlaywrightError("Page crashed")
 
-    def test_browser_error_on_launch_failure(self) -> None:
-        """Test BrowserError is raised when browser launch fails."""
-        from playwright.sync_api import Error as PlaywrightError
+        with pytest.raises(BrowserError, match="Page crashed"):
+            fetch_rendered_html("https://example.com")
 
-        with patch("news_scraper.browser.sync_playwright") as mock_pw:
-            mock_chromium = mock_pw.return_value.__enter__.return_value.chromium
-            mock_chromium.launch.side_effect = PlaywrightError(
-                "Browser executable not found"
-            )
+        pw_mocks.context.close.assert_called_once()
 
-            with pytest.raises(BrowserError, match="Browser executable not found"):
-                fetch_rendered_html("https://example.com")
+    def test_browser_reused_across_calls(self, pw_mocks: SimpleNamespace) -> None:
+        """Test the browser is launched once and shared between fetches."""
+        fetch_rendered_html("https://example.com/a")
+        fetch_rendered_html("https://example.com/b")
 
-    def test_browser_error_on_content_failure(self) -> None:
-        """Test BrowserError is raised when page.content() fails."""
-        from playwright.sync_api import Error as PlaywrightError
+        assert pw_mocks.chromium.launch.call_count == 1
+        assert pw_mocks.browser.new_context.call_count == 2
+        pw_mocks.browser.close.assert_not_called()
+
+    def test_relaunches_disconnected_browser(self, pw_mocks: SimpleNamespace) -> None:
+        """Test a disconnected browser is replaced on the next fetch."""
+        pw_mocks.browser.is_connected.return_value = False
+
+        fetch_rendered_html("https://example.com/a")
+        fetch_rendered_html("https://example.com/b")
+
+        assert pw_mocks.chromium.launch.call_count == 2
+
+    def test_close_shuts_down_browser_and_playwright(
+        self, pw_mocks: SimpleNamespace
+    ) -> None:
+        """Test closing the pool closes the browser and stops Playwright."""
+        _pool.get_browser()
+        _pool.close()
+
+        pw_mocks.browser.close.assert_called_once()
+        pw_mocks.playwright.stop.assert_called_once()
 
-        with patch("news_scraper.browser.sync_playwright") as mock_pw:
-            mock_browser = MagicMock()
-            mock_context = MagicMock()
-            mock_page = MagicMock()
-            mock_page.content.side_effect = PlaywrightError("Page crashed")
+    def test_blocks_heavy_resources(self, pw_mocks: SimpleNamespace) -> None:
+        """Test images, fonts and media are aborted while documents load."""
+        fetch_rendered_html("https://example.com")
 
-            mock_pw.return_value.__enter__.return_value.chromium.launch.return_value = (
-                mock_browser
-            )
-            mock_browser.new_context.return_value = mock_context
-            mock_context.new_page.return_value = mock_page
+        pw_mocks.context.route.assert_called_once_with("**/*", _block_heavy_resources)
 
-            with pytest.raises(BrowserError, match="Page crashed"):
-                fetch_rendered_html("https://example.com")
+        for resource_type in ("image", "font", "media"):
+            route = MagicMock()
+            route.request.resource_type = resource_type
+            _block_heavy_resources(route)
+            route.abort.assert_called_once()
+            route.continue_.assert_not_called()
 
-            mock_browser.close.assert_called_once()
+        for resource_type in ("document", "script", "xhr", "stylesheet"):
+            route = MagicMock()
+            route.request.resource_type = resource_type
+            _block_heavy_resources(route)
+            route.continue_.assert_called_once()
+            route.abort.assert_not_called()
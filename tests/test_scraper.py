@@ -1,9 +1,14 @@
 """Tests for the scraper module."""
 
+from dataclasses import FrozenInstanceError, replace
+from io import StringIO
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
+from rich.console import Console
 
+from news_scraper import scraper as scraper_module
 from news_scraper.browser import BrowserError
 from news_scraper.db.models import Source
 from news_scraper.parsers import ParsedArticle, ParserNotFoundError
@@ -16,104 +21,98 @@ from news_scraper.scraper import (
     scrape,
 )
 
+_MOCK_HTML = "<html></html>"
+
+# Base article for formatting tests; vary fields with dataclasses.replace()
+_ARTICLE = ParsedArticle(
+    headline="Test Headline", url="https://example.com", position=1
+)
+
+
+def _stub_fetch(_url: str) -> str:
+    """Stand-in for fetch_rendered_html that returns a fixed empty page."""
+    return _MOCK_HTML
+
+
+@pytest.fixture
+def scraper_mocks(monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+    """Stub fetching, parser lookup, session and repository for scrape()."""
+    parser = MagicMock()
+    get_parser = MagicMock(return_value=parser)
+    session = MagicMock()
+    get_session = MagicMock()
+    get_session.return_value.__enter__.return_value = session
+    repo = MagicMock()
+    repo.bulk_upsert_from_parsed.return_value = (0, 0, 0)
+
+    monkeypatch.setattr(scraper_module, "fetch_rendered_html", _stub_fetch)
+    monkeypatch.setattr(scraper_module, "get_parser", get_parser)
+    monkeypatch.setattr(scraper_module, "get_session", get_session)
+    monkeypatch.setattr(
+        scraper_module, "ArticleRepository", MagicMock(return_value=repo)
+    )
+    return SimpleNamespace(
+        get_parser=get_parser, parser=parser, session=session, repo=repo
+    )
+
 
 class TestScrape:
     """Tests for the scrape function."""
 
-    def test_scrape_returns_scrape_result(self) -> None:
+    def test_scrape_returns_scrape_result(
+        self, scraper_mocks: SimpleNamespace, infobae_source: Source
+    ) -> None:
         """Test scrape returns ScrapeResult with stats."""
-        source = Source(name="infobae", url="https://www.infobae.com")
-        source.id = 1
-        mock_html = "<html></html>"
         expected_articles = [
             ParsedArticle(
                 headline="Test", url="https://www.infobae.com/test", position=1
             )
         ]
+        scraper_mocks.parser.parse.return_value = expected_articles
+        scraper_mocks.repo.bulk_upsert_from_parsed.return_value = (1, 0, 0)
 
-        with (
-            patch("news_scraper.scraper.fetch_rendered_html") as mock_fetch,
-            patch("news_scraper.scraper.get_parser") as mock_get_parser,
-            patch("news_scraper.scraper.get_session") as mock_get_session,
-            patch("news_scraper.scraper.ArticleRepository") as mock_repo_class,
-        ):
-            mock_fetch.return_value = mock_html
-            mock_parser = MagicMock()
-            mock_parser.parse.return_value = expected_articles
-            mock_get_parser.return_value = mock_parser
-
-            # Mock session and repository
-            mock_session = MagicMock()
-            mock_get_session.return_value.__enter__.return_value = mock_session
-            mock_repo = MagicMock()
-            mock_repo.bulk_upsert_from_parsed.return_value = (1, 0, 0)
-            mock_repo_class.return_value = mock_repo
-
-            result = scrape(source)
-
-            assert isinstance(result, ScrapeResult)
-            assert result.articles == expected_articles
-            assert result.created_count == 1
-            assert result.updated_count == 0
-            assert result.skipped_count == 0
-
-    def test_scrape_raises_for_unknown_source(self) -> None:
+        result = scrape(infobae_source)
+
+        assert isinstance(result, ScrapeResult)
+        assert result.articles == expected_articles
+        assert result.created_count == 1
+        assert result.updated_count == 0
+        assert result.skipped_count == 0
+
+    def test_scrape_raises_for_unknown_source(
+        self, scraper_mocks: SimpleNamespace
+    ) -> None:
         """Test scrape raises ScraperError for unknown source."""
         source = Source(name="unknown", url="https://unknown.com")
+        scraper_mocks.get_parser.side_effect = ParserNotFoundError("unknown")
 
-        with (
-            patch("news_scraper.scraper.fetch_rendered_html") as mock_fetch,
-            patch("news_scraper.scraper.get_parser") as mock_get_parser,
-        ):
-            mock_fetch.return_value = "<html></html>"
-            mock_get_parser.side_effect = ParserNotFoundError("unknown")
+        with pytest.raises(ScraperError, match="unknown"):
+            scrape(source)
 
-            with pytest.raises(ScraperError):
-                scrape(source)
-
-    def test_scrape_wraps_browser_error(self) -> None:
+    def test_scrape_wraps_browser_error(self, infobae_source: Source) -> None:
         """Test scrape wraps BrowserError as ScraperError."""
-        source = Source(name="infobae", url="https://www.infobae.com")
         error_message = "Navigation timeout exceeded"
 
         with patch("news_scraper.scraper.fetch_rendered_html") as mock_fetch:
-            mock_fetch.side_effect = BrowserError(error_message, source.url)
+            mock_fetch.side_effect = BrowserError(error_message, infobae_source.url)
 
-            with pytest.raises(ScraperError) as exc_info:
-                scrape(source)
+            with pytest.raises(ScraperError, match=error_message) as exc_info:
+                scrape(infobae_source)
 
-            assert exc_info.value.message == error_message
-            assert exc_info.value.source_name == source.name
+            assert exc_info.value.source_name == infobae_source.name
 
-    def test_scrape_empty_parse_result(self) -> None:
+    def test_scrape_empty_parse_result(
+        self, scraper_mocks: SimpleNamespace, infobae_source: Source
+    ) -> None:
         """Test scrape handles parser returning empty list."""
-        source = Source(name="infobae", url="https://www.infobae.com")
-        source.id = 1
-
-        with (
-            patch("news_scraper.scraper.fetch_rendered_html") as mock_fetch,
-            patch("news_scraper.scraper.get_parser") as mock_get_parser,
-            patch("news_scraper.scraper.get_session") as mock_get_session,
-            patch("news_scraper.scraper.ArticleRepository") as mock_repo_class,
-        ):
-            mock_fetch.return_value = "<html></html>"
-            mock_parser = MagicMock()
-            mock_parser.parse.return_value = []
-            mock_get_parser.return_value = mock_parser
-
-            # Mock session and repository
-            mock_session = MagicMock()
-            mock_get_session.return_value.__enter__.return_value = mock_session
-            mock_repo = MagicMock()
-            mock_repo.bulk_upsert_from_parsed.return_value = (0, 0, 0)
-            mock_repo_class.return_value = mock_repo
-
-            result = scrape(source)
-
-            assert result.articles == []
-            assert result.created_count == 0
-            assert result.updated_count == 0
-            assert result.skipped_count == 0
+        scraper_mocks.parser.parse.return_value = []
+
+        result = scrape(infobae_source)
+
+        assert result.articles == []
+        assert result.created_count == 0
+        assert result.updated_count == 0
+        assert result.skipped_count == 0
 
 
 class TestFormatArticle:
@@ -121,43 +120,28 @@ class TestFormatArticle:
 
     def test_format_article_basic(self) -> None:
         """Test formatting article with required fields only."""
-        article = ParsedArticle(
-            headline="Test Headline", url="https://example.com", position=1
-        )
-        result = format_article(article, 1)
+        result = format_article(_ARTICLE, 1)
 
         assert "[1] Test Headline" in result
         assert "URL: https://example.com" in result
 
     def test_format_article_includes_position(self) -> None:
         """Test formatting includes position."""
-        article = ParsedArticle(
-            headline="Test Headline", url="https://example.com", position=5
-        )
+        article = replace(_ARTICLE, position=5)
         result = format_article(article, 1)
 
         assert "Position: 5" in result
 
     def test_format_article_with_summary(self) -> None:
         """Test formatting article with summary."""
-        article = ParsedArticle(
-            headline="Test",
-            url="https://example.com",
-            position=1,
-            summary="This is a summary",
-        )
+        article = replace(_ARTICLE, summary="This is a summary")
         result = format_article(article, 1)
 
         assert "Summary: This is a summary" in result
 
     def test_format_article_with_image(self) -> None:
         """Test formatting article with image."""
-        article = ParsedArticle(
-            headline="Test",
-            url="https://example.com",
-            position=1,
-            image_url="https://example.com/image.jpg",
-        )
+        article = replace(_ARTICLE, image_url="https://example.com/image.jpg")
         result = format_article(article, 1)
 
         assert "Image: https://example.com/image.jpg" in result
@@ -165,24 +149,16 @@ class TestFormatArticle:
     def test_format_article_truncates_long_summary(self) -> None:
         """Test that long summaries are truncated at SUMMARY_MAX_LENGTH."""
         long_summary = "x" * (SUMMARY_MAX_LENGTH + 100)
-        article = ParsedArticle(
-            headline="Test", url="https://example.com", position=1, summary=long_summary
-        )
+        article = replace(_ARTICLE, summary=long_summary)
         result = format_article(article, 1)
 
-        assert "..." in result
-        # Summary line should contain truncated text
-        assert f"{'x' * SUMMARY_MAX_LENGTH}..." in result
+        summary_line = next(line for line in result.splitlines() if "Summary:" in line)
+        assert summary_line == f"    Summary: {'x' * SUMMARY_MAX_LENGTH}..."
 
     def test_format_article_short_summary_not_truncated(self) -> None:
         """Test that short summaries are not truncated."""
         short_summary = "x" * (SUMMARY_MAX_LENGTH - 10)
-        article = ParsedArticle(
-            headline="Test",
-            url="https://example.com",
-            position=1,
-            summary=short_summary,
-        )
+        article = replace(_ARTICLE, summary=short_summary)
         result = format_article(article, 1)
 
         assert "..." not in result
@@ -206,10 +182,36 @@ class TestFormatArticle:
         assert "[red]Breaking[/red]" not in result
 
 
+class TestScrapeResult:
+    """Tests for the ScrapeResult dataclass."""
+
+    def test_is_immutable(self) -> None:
+        """Test ScrapeResult fields cannot be reassigned."""
+        result = ScrapeResult(
+            articles=[], created_count=0, updated_count=0, skipped_count=0
+        )
+        with pytest.raises(FrozenInstanceError):
+            result.created_count = 1  # type: ignore[misc]
+
+    def test_has_no_instance_dict(self) -> None:
+        """Test ScrapeResult uses slots instead of a per-instance __dict__."""
+        result = ScrapeResult(
+            articles=[], created_count=0, updated_count=0, skipped_count=0
+        )
+        assert not hasattr(result, "__dict__")
+
+
+def _printed(result: ScrapeResult) -> str:
+    """Return what print_scrape_result writes for result."""
+    buffer = StringIO()
+    print_scrape_result(result, console=Console(file=buffer))
+    return buffer.getvalue()
+
+
 class TestPrintScrapeResult:
     """Tests for print_scrape_result function."""
 
-    def test_print_result_empty(self, capsys: pytest.CaptureFixture[str]) -> None:
+    def test_print_result_empty(self) -> None:
         """Test printing empty result."""
         result = ScrapeResult(
             articles=[],
@@ -217,14 +219,11 @@ class TestPrintScrapeResult:
             updated_count=0,
             skipped_count=0,
         )
-        print_scrape_result(result)
-        captured = capsys.readouterr()
+        output = _printed(result)
 
-        assert "No articles found" in captured.out
+        assert "No articles found" in output
 
-    def test_print_result_shows_counts(
-        self, capsys: pytest.CaptureFixture[str]
-    ) -> None:
+    def test_print_result_shows_counts(self) -> None:
         """Test printing shows article counts."""
         result = ScrapeResult(
             articles=[
@@ -234,15 +233,12 @@ class TestPrintScrapeResult:
             updated_count=3,
             skipped_count=0,
         )
-        print_scrape_result(result)
-        captured = capsys.readouterr()
+        output = _printed(result)
 
-        assert "New: 5" in captured.out
-        assert "Updated: 3" in captured.out
+        assert "New: 5" in output
+        assert "Updated: 3" in output
 
-    def test_print_result_shows_skipped_when_nonzero(
-        self, capsys: pytest.CaptureFixture[str]
-    ) -> None:
+    def test_print_result_shows_skipped_when_nonzero(self) -> None:
         """Test printing shows skipped count when > 0."""
         result = ScrapeResult(
             articles=[
@@ -252,15 +248,12 @@ class TestPrintScrapeResult:
             updated_count=3,
             skipped_count=2,
         )
-        print_scrape_result(result)
-        captured = capsys.readouterr()
+        output = _printed(result)
 
-        assert "Skipped" in captured.out
-        assert "2" in captured.out
+        assert "Skipped" in output
+        assert "2" in output
 
-    def test_print_result_shows_article_count(
-        self, capsys: pytest.CaptureFixture[str]
-    ) -> None:
+    def test_print_result_shows_article_count(self) -> None:
         """Test printing shows total article count."""
         result = ScrapeResult(
             articles=[
@@ -275,7 +268,6 @@ class TestPrintScrapeResult:
             updated_count=0,
             skipped_count=0,
         )
-        print_scrape_result(result)
-        captured = capsys.readouterr()
+        output = _printed(result)
 
-        assert "Found 2 articles" in captured.out
+        assert "Found 2 articles" in output
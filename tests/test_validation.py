@@ -8,91 +8,70 @@ from news_scraper.validation import (
     validate_slug,
 )
 
+# (input, normalized slug)
+VALID_SLUGS = [
+    pytest.param("infobae", "infobae", id="lowercase"),
+    pytest.param("news24", "news24", id="numbers"),
+    pytest.param("la-nacion", "la-nacion", id="hyphen"),
+    pytest.param("la_nacion", "la_nacion", id="underscore"),
+    pytest.param("news_24", "news_24", id="underscore-and-numbers"),
+    pytest.param("INFOBAE", "infobae", id="uppercase"),
+    pytest.param("LaNacion", "lanacion", id="mixed-case"),
+    pytest.param("a" * 100, "a" * 100, id="max-length"),
+]
+
+INVALID_SLUGS = [
+    pytest.param("", id="empty"),
+    pytest.param("invalid source", id="whitespace"),
+    pytest.param("infobae\n", id="trailing-newline"),
+    pytest.param("source@name", id="at-sign"),
+    pytest.param("source!name", id="exclamation"),
+    pytest.param("source.name", id="dot"),
+    pytest.param("-invalid", id="leading-hyphen"),
+    pytest.param("_invalid", id="leading-underscore"),
+    pytest.param("a" * 101, id="too-long"),
+]
+
 
 class TestValidateSlug:
     """Tests for validate_slug function."""
 
-    def test_valid_lowercase_slug(self) -> None:
-        """Test valid lowercase slug passes."""
-        assert validate_slug("infobae") == "infobae"
-
-    def test_valid_slug_with_numbers(self) -> None:
-        """Test slug with numbers passes."""
-        assert validate_slug("news24") == "news24"
-
-    def test_valid_slug_with_hyphen(self) -> None:
-        """Test slug with hyphen passes."""
-        assert validate_slug("la-nacion") == "la-nacion"
-
-    def test_valid_slug_with_underscore(self) -> None:
-        """Test slug with underscore passes."""
-        assert validate_slug("la_nacion") == "la_nacion"
+    @pytest.mark.parametrize(("value", "expected"), VALID_SLUGS)
+    def test_valid_slug_is_normalized(self, value: str, expected: str) -> None:
+        """Test valid slugs pass and are normalized to lowercase."""
+        assert validate_slug(value) == expected
 
-    def test_normalizes_to_lowercase(self) -> None:
-        """Test uppercase is normalized to lowercase."""
-        assert validate_slug("INFOBAE") == "infobae"
-        assert validate_slug("LaNacion") == "lanacion"
+    @pytest.mark.parametrize("value", INVALID_SLUGS)
+    def test_invalid_slug_raises(self, value: str) -> None:
+        """Test invalid slugs raise ValidationError."""
+        with pytest.raises(ValidationError):
+            validate_slug(value)
 
     def test_empty_string_raises(self) -> None:
         """Test empty string raises ValidationError."""
-        with pytest.raises(ValidationError) as exc_info:
+        with pytest.raises(ValidationError, match="cannot be empty"):
             validate_slug("")
-        assert "cannot be empty" in str(exc_info.value)
-
-    def test_whitespace_raises(self) -> None:
-        """Test string with whitespace raises ValidationError."""
-        with pytest.raises(ValidationError):
-            validate_slug("invalid source")
-
-    def test_special_characters_raise(self) -> None:
-        """Test special characters raise ValidationError."""
-        with pytest.raises(ValidationError):
-            validate_slug("source@name")
-        with pytest.raises(ValidationError):
-            validate_slug("source!name")
-        with pytest.raises(ValidationError):
-            validate_slug("source.name")
-
-    def test_starting_with_hyphen_raises(self) -> None:
-        """Test slug starting with hyphen raises ValidationError."""
-        with pytest.raises(ValidationError):
-            validate_slug("-invalid")
-
-    def test_starting_with_underscore_raises(self) -> None:
-        """Test slug starting with underscore raises ValidationError."""
-        with pytest.raises(ValidationError):
-            validate_slug("_invalid")
 
     def test_too_long_raises(self) -> None:
         """Test slug exceeding max length raises ValidationError."""
-        long_slug = "a" * 101
-        with pytest.raises(ValidationError) as exc_info:
-            validate_slug(long_slug)
-        assert "cannot exceed" in str(exc_info.value)
-
-    def test_max_length_passes(self) -> None:
-        """Test slug at max length passes."""
-        max_slug = "a" * 100
-        assert validate_slug(max_slug) == max_slug
+        with pytest.raises(ValidationError, match="cannot exceed 100 characters"):
+            validate_slug("a" * 101)
 
     def test_custom_field_name_in_error(self) -> None:
         """Test custom field name appears in error message."""
-        with pytest.raises(ValidationError) as exc_info:
+        with pytest.raises(ValidationError, match="^source: "):
             validate_slug("", field_name="source")
-        assert "source" in str(exc_info.value)
 
 
 class TestIsValidSlug:
     """Tests for is_valid_slug function."""
 
-    def test_valid_slug_returns_true(self) -> None:
+    @pytest.mark.parametrize(("value", "_expected"), VALID_SLUGS)
+    def test_valid_slug_returns_true(self, value: str, _expected: str) -> None:
         """Test valid slug returns True."""
-        assert is_valid_slug("infobae") is True
-        assert is_valid_slug("la-nacion") is True
-        assert is_valid_slug("news_24") is True
+        assert is_valid_slug(value) is True
 
-    def test_invalid_slug_returns_false(self) -> None:
+    @pytest.mark.parametrize("value", INVALID_SLUGS)
+    def test_invalid_slug_returns_false(self, value: str) -> None:
         """Test invalid slug returns False."""
-        assert is_valid_slug("") is False
-        assert is_valid_slug("invalid source") is False
-        assert is_valid_slug("-invalid") is False
+        assert is_valid_slug(value) is False